@@ -27,539 +27,451 @@ are arrays.
   array-like and array arguments
 
 """
+import inspect
+
 import numpy as np
-from scipy._lib._array_api import array_namespace, np_compat
 
+# The scipy._lib._array_api import is deferred so that loading this module
+# does not pull in the array-API compat machinery: `array_namespace` starts
+# out as a trampoline which resolves the real function on its first call
+# and rebinds the module globals, making every later call go straight
+# through. `np_compat` and `_NUMPY_NS` are resolved along with it.
+array_namespace = None
+np_compat = None
+_NUMPY_NS = None
 
-def _skip_if_lti(arg):
-    """Handle `system` arg overloads.
 
-    ATM, only pass tuples through. Consider updating when cupyx.lti class
-    is supported.
-    """
-    if isinstance(arg, tuple):
-        return arg
-    else:
-        return (None,)
+def _lazy_ns(*args, **kwds):
+    global array_namespace, np_compat, _NUMPY_NS
+    from scipy._lib._array_api import array_namespace as _real
+    from scipy._lib._array_api import np_compat as _compat
+    array_namespace = _real
+    np_compat = _compat
+    _NUMPY_NS = _real(np.empty(0))
+    return _real(*args, **kwds)
 
 
-def _skip_if_str_or_tuple(window):
-    """Handle `window` being a str or a tuple or an array-like.
-    """
-    if isinstance(window, str) or isinstance(window, tuple) or callable(window):
-        return None
-    else:
-        return window
+array_namespace = _lazy_ns
 
 
-def _skip_if_poly1d(arg):
-    return None if isinstance(arg, np.poly1d) else arg
+# The namespace returned by `array_namespace` only depends on the *types* of
+# its arguments, never on their values. Memoize the lookup on the tuple of
+# argument types, so that repeat calls with the same types (e.g. NumPy-only
+# user loops over `lfilter`, `welch` etc) reduce to a single dict lookup.
+# Do not cache keys which contain builtin containers or strings: those are
+# array-like coercion cases where `array_namespace` inspects the values.
+_ns_cache = {}
+_NS_CACHE_MAXSIZE = 256
 
 
-###################
+def _is_cacheable(key):
+    return not any(t is tuple or t is list or t is str for t in key)
 
-def abcd_normalize_signature(A=None, B=None, C=None, D=None):
-    return array_namespace(A, B, C, D)
 
+# `array_namespace` resolves any mix of NumPy arrays, Python scalars and
+# None to the same namespace, so that case -- the overwhelmingly common one
+# -- can be answered with a plain type loop instead of running the general
+# dispatcher with its attribute checks and `__array_namespace__` probes.
+# `_NUMPY_NS` is None until the lazy import above has run, so fall back to
+# `array_namespace` (i.e. the trampoline) until then.
+_SCALAR_TYPES = (int, float, complex, bool)
 
-def argrelextrema_signature(data, *args, **kwds):
-    return array_namespace(data)
 
-argrelmax_signature = argrelextrema_signature
-argrelmin_signature = argrelextrema_signature
+def _fast_ns(*args, _ndarray=np.ndarray, _scalars=_SCALAR_TYPES):
+    for arg in args:
+        cls = arg.__class__
+        if cls is _ndarray or arg is None or cls in _scalars:
+            continue
+        return array_namespace(*args)
+    ns = _NUMPY_NS
+    return ns if ns is not None else array_namespace(*args)
 
 
-def band_stop_obj_signature(wp, ind, passb, stopb, gpass, gstop, type):
-    return array_namespace(passb, stopb)
+# The dispatcher core stays pure Python -- a compiled extension is not
+# warranted for this optional layer -- but the hit path is kept to C-level
+# operations only: map/tuple/type run in C, and the bound _ns_cache.get
+# avoids both an attribute lookup and a Python-level loop over the args.
+def _dispatch(*args, _get=_ns_cache.get, _map=map, _tuple=tuple, _type=type):
+    key = _tuple(_map(_type, args))
+    ns = _get(key)
+    if ns is None:
+        ns = _fast_ns(*args)
+        if len(_ns_cache) < _NS_CACHE_MAXSIZE and _is_cacheable(key):
+            _ns_cache[key] = ns
+    return ns
 
 
-def bessel_signature(N, Wn, *args, **kwds):
-    return array_namespace(Wn)
+# Handle `system` arg overloads: ATM, only pass tuples through; anything
+# else dispatches as NumPy. When cupyx.lti support lands, extending
+# _LTI_TYPES is the only change needed -- the generated signatures test
+# ``system.__class__ in _LTI_TYPES``, which for a tuple this small is
+# cheaper than an isinstance MRO walk. The preallocated _LTI_NONE sentinel
+# avoids building a fresh 1-tuple on every call.
+_LTI_TYPES = (tuple,)
+_LTI_NONE = (None,)
 
-butter_signature = bessel_signature
 
+# Handle `window` being a str or a tuple or an array-like: the spectral
+# delegators only dispatch on `window` when it is an array-like. The
+# `(str, tuple)` tuple is built from global names, so a literal in the
+# isinstance call would be assembled anew per call; hoist it like
+# _LTI_NONE above.
+_STR_OR_TUPLE = (str, tuple)
 
-def cheby2_signature(N, rs, Wn, *args, **kwds):
-    return array_namespace(Wn)
 
+def _skip_if_poly1d(arg, _poly1d=np.poly1d):
+    # exact-type check: the common case is a plain ndarray (or None), and
+    # poly1d is not meaningfully subclassed in practice; np.poly1d is
+    # resolved once at def time rather than per call
+    return None if arg.__class__ is _poly1d else arg
 
-def cheby1_signature(N, rp, Wn, *args, **kwds):
-    return array_namespace(Wn)
 
+# Shared bodies for signatures which never dispatch on an array argument
+# ("no arrays in" / "scalars in"): one function object per behavior instead
+# of a separate def per name.
 
-def ellip_signature(N, rp, rs, Wn, *args, **kwds):
-    return array_namespace(Wn)
+def _return_np(*args, _np=np, **kwds):
+    return _np
 
 
-########################## XXX: no arrays in, arrays out
-def besselap_signature(N, norm='phase', *, xp=None, device=None):
-    return np if xp is None else xp
+def _return_xp_or_np(*args, xp=None, _np=np, **kwds):
+    return _np if xp is None else xp
 
 
-def buttap_signature(N, *, xp=None, device=None):
-    return np if xp is None else xp
+def _return_xp_or_np_compat(*args, xp=None, **kwds):
+    if xp is not None:
+        return xp
+    global np_compat
+    if np_compat is None:
+        from scipy._lib._array_api import np_compat
+    return np_compat
 
 
-def cheb1ap_signature(N, rp, *, xp=None, device=None):
-    return np if xp is None else xp
+###################
 
+# Most delegators follow a single pattern: dispatch on a fixed subset of the
+# arguments of `signal.func`. These are generated from the table below
+# rather than spelled out as hand-written stubs: compiling a specialized
+# body per signature leaves no helper calls or star-unpacking on the
+# per-call path, and `_dispatch` is bound as a default argument so the
+# call does a LOAD_FAST instead of a global lookup.
+#
+# name -> (parameter list of signal.<name>, arguments to dispatch on)
+_SIMPLE_SIGNATURES = {
+    "abcd_normalize": ("A=None, B=None, C=None, D=None", "A, B, C, D"),
+    "argrelextrema": ("data, *args, **kwds", "data"),
+    "band_stop_obj": ("wp, ind, passb, stopb, gpass, gstop, type",
+                      "passb, stopb"),
+    "bessel": ("N, Wn, *args, **kwds", "Wn"),
+    "cheby1": ("N, rp, Wn, *args, **kwds", "Wn"),
+    "cheby2": ("N, rs, Wn, *args, **kwds", "Wn"),
+    "ellip": ("N, rp, rs, Wn, *args, **kwds", "Wn"),
+    "buttord": ("wp, ws, gpass, gstop, analog=False, fs=None", "wp, ws"),
+    "bilinear": ("b, a, fs=1.0", "b, a"),
+    "bilinear_zpk": ("z, p, k, fs", "z, p"),
+    "chirp": ("t, *args, **kwds", "t"),
+    # XXX: array-likes in, str out
+    "choose_conv_method": ("in1, in2, *args, **kwds", "in1, in2"),
+    "convolve": ("in1, in2, *args, **kwds", "in1, in2"),
+    "czt": ("x, *args, **kwds", "x"),
+    "deconvolve": ("signal, divisor", "signal, divisor"),
+    "detrend": ("data, axis=1, type='linear', bp=0, *args, **kwds",
+                "data, bp"),
+    "filtfilt": ("b, a, x, *args, **kwds", "b, a, x"),
+    "lfilter": ("b, a, x, axis=-1, zi=None", "b, a, x, zi"),
+    "envelope": ("z, *args, **kwds", "z"),
+    "find_peaks": ("x, height=None, threshold=None, distance=None, "
+                   "prominence=None, width=None, wlen=None, rel_height=0.5, "
+                   "plateau_size=None",
+                   "x, height, threshold, prominence, width, plateau_size"),
+    "find_peaks_cwt": ("vector, widths, wavelet=None, max_distances=None, "
+                       "*args, **kwds",
+                       "vector, widths, max_distances"),
+    "findfreqs": ("num, den, N, kind='ba'", "num, den"),
+    "firls": ("numtaps, bands, desired, *, weight=None, fs=None",
+              "bands, desired, weight"),
+    "firwin2": ("numtaps, freq, gain, *args, **kwds", "freq, gain"),
+    "freqs_zpk": ("z, p, k, worN, *args, **kwds", "z, p, worN"),
+    "freqs": ("b, a, worN=200, *args, **kwds", "b, a, worN"),
+    "freqz_sos": ("sos, worN=512, *args, **kwds", "sos, worN"),
+    "hilbert": ("x, N=None, axis=-1", "x"),
+    "iirdesign": ("wp, ws, *args, **kwds", "wp, ws"),
+    "iirfilter": ("N, Wn, *args, **kwds", "Wn"),
+    "invres": ("r, p, k, tol=0.001, rtype='avg'", "r, p, k"),
+    # XXX: excluded, blacklisted on CuPy (mismatched API)
+    "lfilter_zi": ("b, a", "b, a"),
+    "sosfilt_zi": ("sos", "sos"),
+    # needs to be blacklisted on CuPy (is not implemented)
+    "remez": ("numtaps, bands, desired, *, weight=None, **kwds",
+              "bands, desired, weight"),
+    "lfiltic": ("b, a, y, x=None", "b, a, y, x"),
+    "lombscargle": ("x, y, freqs, precenter=False, normalize=False, *, "
+                    "weights=None, floating_mean=False",
+                    "x, y, freqs, weights"),
+    "lp2bp": ("b, a, *args, **kwds", "b, a"),
+    "lp2bp_zpk": ("z, p, k, *args, **kwds", "z, p"),
+    "zpk2sos": ("z, p, k, *args, **kwds", "z, p"),
+    "max_len_seq": ("nbits, state=None, length=None, taps=None",
+                    "state, taps"),
+    "medfilt": ("volume, kernel_size=None", "volume"),
+    "medfilt2d": ("input, kernel_size=3", "input"),
+    "minimum_phase": ("h, *args, **kwds", "h"),
+    "order_filter": ("a, domain, rank", "a, domain"),
+    "peak_prominences": ("x, peaks, *args, **kwds", "x, peaks"),
+    "place_poles": ("A, B, poles, method='YT', rtol=0.001, maxiter=30",
+                    "A, B, poles"),
+    "savgol_filter": ("x, *args, **kwds", "x"),
+    "sawtooth": ("t, width=1", "t"),
+    "sepfir2d": ("input, hrow, hcol", "input, hrow, hcol"),
+    "sos2tf": ("sos", "sos"),
+    "sosfilt": ("sos, x, axis=-1, zi=None", "sos, x, zi"),
+    "sosfiltfilt": ("sos, x, *args, **kwds", "sos, x"),
+    "spline_filter": ("Iin, lmbda=5.0", "Iin"),
+    "square": ("t, duty=0.5", "t"),
+    "ss2tf": ("A, B, C, D, input=0", "A, B, C, D"),
+    "symiirorder1": ("signal, c0, z1, precision=-1.0", "signal"),
+    "symiirorder2": ("input, r, omega, precision=-1.0", "input, r, omega"),
+    "cspline1d": ("signal, *args, **kwds", "signal"),
+    "cspline1d_eval": ("cj, newx, *args, **kwds", "cj, newx"),
+    "tf2ss": ("num, den", "num, den"),
+    "unique_roots": ("p, tol=0.001, rtype='min'", "p"),
+    "upfirdn": ("h, x, up=1, down=1, axis=-1, mode='constant', cval=0",
+                "h, x"),
+    "vectorstrength": ("events, period", "events, period"),
+    "wiener": ("im, mysize=None, noise=None", "im"),
+    "zoom_fft": ("x, fn, m=None, *, fs=2, endpoint=False, axis=-1", "x, fn"),
+}
+
+
+_SIMPLE_TEMPLATE = """\
+def {name}_signature({params}):
+    return _ns({arrays})
+"""
 
-def cheb2ap_signature(N, rs, *, xp=None, device=None):
-    return np if xp is None else xp
 
-def ellipap_signature(N, rp, rs, *, xp=None, device=None):
-    return np if xp is None else xp
+def _inject_defaults(params, aliases):
+    # slot the fast-local aliases in as keyword-only default arguments
+    if "**" in params:
+        return params.replace("**", aliases + ", **")
+    if "*" in params:
+        return f"{params}, {aliases}"
+    return f"{params}, *, {aliases}"
+
+
+def _generate_signatures(table, template, aliases, namespace):
+    # entries with identical specs share a single function object, so call
+    # sites dispatching across several scipy.signal APIs hit one code object
+    generated = {}
+    for name, spec in table.items():
+        shared = generated.get(spec)
+        if shared is not None:
+            namespace[f"{name}_signature"] = shared
+            continue
+        params, arrays = spec
+        code = template.format(
+            name=name,
+            params=_inject_defaults(params, aliases),
+            arrays=arrays,
+            arrays_and_window=f"{arrays}, window" if arrays else "window",
+        )
+        exec(code, namespace)
+        generated[spec] = namespace[f"{name}_signature"]
+
+
+_generate_signatures(_SIMPLE_SIGNATURES, _SIMPLE_TEMPLATE, "_ns=_dispatch",
+                     globals())
+
+
+argrelmax_signature = argrelextrema_signature       # noqa: F821
+argrelmin_signature = argrelextrema_signature       # noqa: F821
+
+butter_signature = bessel_signature                 # noqa: F821
+
+cheb1ord_signature = buttord_signature              # noqa: F821
+cheb2ord_signature = buttord_signature              # noqa: F821
+ellipord_signature = buttord_signature              # noqa: F821
+
+fftconvolve_signature = convolve_signature          # noqa: F821
+oaconvolve_signature = convolve_signature           # noqa: F821
+correlate_signature = convolve_signature            # noqa: F821
+convolve2d_signature = convolve_signature           # noqa: F821
+correlate2d_signature = convolve_signature          # noqa: F821
+
+decimate_signature = czt_signature                  # noqa: F821
+gauss_spline_signature = czt_signature              # noqa: F821
+
+freqz_zpk_signature = freqs_zpk_signature           # noqa: F821
+freqz_signature = freqs_signature                   # noqa: F821
+sosfreqz_signature = freqz_sos_signature            # noqa: F821
+
+hilbert2_signature = hilbert_signature              # noqa: F821
+
+invresz_signature = invres_signature                # noqa: F821
+
+lp2bs_signature = lp2bp_signature                   # noqa: F821
+lp2hp_signature = lp2bp_signature                   # noqa: F821
+lp2lp_signature = lp2bp_signature                   # noqa: F821
+tf2zpk_signature = lp2bp_signature                  # noqa: F821
+tf2sos_signature = lp2bp_signature                  # noqa: F821
+normalize_signature = lp2bp_signature               # noqa: F821
+residue_signature = lp2bp_signature                 # noqa: F821
+residuez_signature = residue_signature
 
-def correlation_lags_signature(in1_len, in2_len, mode='full'):
-    return np
+lp2bs_zpk_signature = lp2bp_zpk_signature           # noqa: F821
+lp2hp_zpk_signature = lp2bs_zpk_signature
+lp2lp_zpk_signature = lp2bs_zpk_signature
 
+zpk2ss_signature = zpk2sos_signature                # noqa: F821
+zpk2tf_signature = zpk2sos_signature                # noqa: F821
 
-def czt_points_signature(m, w=None, a=(1+0j)):
-    return np
+peak_widths_signature = peak_prominences_signature  # noqa: F821
 
+sos2zpk_signature = sos2tf_signature                # noqa: F821
+ss2zpk_signature = ss2tf_signature                  # noqa: F821
 
-def gammatone_signature(
-    freq, ftype, order=None, numtaps=None, fs=None, *, xp=None, device=None
-    ):
-    return np_compat if xp is None else xp
+qspline1d_signature = cspline1d_signature           # noqa: F821
+cspline2d_signature = cspline1d_signature           # noqa: F821
+qspline2d_signature = qspline1d_signature
+qspline1d_eval_signature = cspline1d_eval_signature  # noqa: F821
 
 
-def iircomb_signature(
-    w0, Q, ftype='notch', fs=2.0, *, pass_zero=False, xp=None, device=None
-):
-    return np_compat if xp is None else xp
+########################## XXX: no arrays in, arrays out
+besselap_signature = _return_xp_or_np
+buttap_signature = _return_xp_or_np
+cheb1ap_signature = _return_xp_or_np
+cheb2ap_signature = _return_xp_or_np
+ellipap_signature = _return_xp_or_np
 
+correlation_lags_signature = _return_np
+czt_points_signature = _return_np
 
-def iirnotch_signature(w0, Q, fs=2.0, *, xp=None, device=None):
-    return np if xp is None else xp
+gammatone_signature = _return_xp_or_np_compat
+iircomb_signature = _return_xp_or_np_compat
 
+iirnotch_signature = _return_xp_or_np
 iirpeak_signature = iirnotch_signature
 
-
-def savgol_coeffs_signature(
-    window_length, polyorder, deriv=0, delta=1.0, pos=None, use='conv'
-):
-    return np
-
-
-def unit_impulse_signature(shape, idx=None, dtype=float):
-    return np
+savgol_coeffs_signature = _return_np
+unit_impulse_signature = _return_np
 ############################
 
 
-def buttord_signature(wp, ws, gpass, gstop, analog=False, fs=None):
-    return array_namespace(wp, ws)
-
-cheb1ord_signature = buttord_signature
-cheb2ord_signature = buttord_signature
-ellipord_signature = buttord_signature
-
-
 ########### NB: scalars in, scalars out
-def kaiser_atten_signature(numtaps, width):
-    return np
-
-def kaiser_beta_signature(a):
-    return np
-
-def kaiserord_signature(ripple, width):
-    return np
+kaiser_atten_signature = _return_np
+kaiser_beta_signature = _return_np
+kaiserord_signature = _return_np
 
-def get_window_signature(window, Nx, fftbins=True, *, xp=None, device=None):
-    return np if xp is None else xp
+get_window_signature = _return_xp_or_np
 #################################
 
 
-def bode_signature(system, w=None, n=100):
-    return array_namespace(*_skip_if_lti(system), w)
-
-dbode_signature = bode_signature
-
-
-def freqresp_signature(system, w=None, n=10000):
-    return array_namespace(*_skip_if_lti(system), w)
-
-dfreqresp_signature = freqresp_signature
-
-
-def impulse_signature(system, X0=None, T=None, N=None):
-    return array_namespace(*_skip_if_lti(system), X0, T)
-
-
-def dimpulse_signature(system, x0=None, t=None, n=None):
-    return array_namespace(*_skip_if_lti(system), x0, t)
-
-
-def lsim_signature(system, U, T, X0=None, interp=True):
-    return array_namespace(*_skip_if_lti(system), U, T, X0)
-
-
-def dlsim_signature(system, u, t=None, x0=None):
-    return array_namespace(*_skip_if_lti(system), u, t, x0)
-
-
-def step_signature(system, X0=None, T=None, N=None):
-    return array_namespace(*_skip_if_lti(system), X0, T)
-
-def dstep_signature(system, x0=None, t=None, n=None):
-    return array_namespace(*_skip_if_lti(system), x0, t)
-
-
-def cont2discrete_signature(system, dt, method='zoh', alpha=None):
-    return array_namespace(*_skip_if_lti(system))
-
-
-def bilinear_signature(b, a, fs=1.0):
-    return array_namespace(b, a)
-
-
-def bilinear_zpk_signature(z, p, k, fs):
-    return array_namespace(z, p)
-
-
-def chirp_signature(t,*args, **kwds):
-    return array_namespace(t)
-
-
-############## XXX: array-likes in, str out
-def choose_conv_method_signature(in1, in2, *args, **kwds):
-    return array_namespace(in1, in2)
-############################################
-
-
-def convolve_signature(in1, in2, *args, **kwds):
-    return array_namespace(in1, in2)
-
-fftconvolve_signature = convolve_signature
-oaconvolve_signature = convolve_signature
-correlate_signature = convolve_signature
-correlate_signature = convolve_signature
-convolve2d_signature = convolve_signature
-correlate2d_signature = convolve_signature
-
-
-def coherence_signature(x, y, fs=1.0, window='hann', *args, **kwds):
-    return array_namespace(x, y, _skip_if_str_or_tuple(window))
-
-
-def csd_signature(x, y, fs=1.0, window='hann', *args, **kwds):
-    return array_namespace(x, y, _skip_if_str_or_tuple(window))
-
-
-def periodogram_signature(x, fs=1.0, window='boxcar'):
-    return array_namespace(x, _skip_if_str_or_tuple(window))
-
-
-def welch_signature(x, fs=1.0, window='hann', *args, **kwds):
-    return array_namespace(x, _skip_if_str_or_tuple(window))
-
-
-def spectrogram_signature(x, fs=1.0, window=('tukey', 0.25), *args, **kwds):
-    return array_namespace(x, _skip_if_str_or_tuple(window))
-
-
-def stft_signature(x, fs=1.0, window='hann', *args, **kwds):
-    return array_namespace(x, _skip_if_str_or_tuple(window))
-
-
-def istft_signature(Zxx, fs=1.0, window='hann', *args, **kwds):
-    return array_namespace(Zxx, _skip_if_str_or_tuple(window))
-
-
-def resample_signature(x, num, t=None, axis=0, window=None, domain='time'):
-    return array_namespace(x, t, _skip_if_str_or_tuple(window))
-
-
-def resample_poly_signature(x, up, down, axis=0, window=('kaiser', 5.0), *args, **kwds):
-    return array_namespace(x, _skip_if_str_or_tuple(window))
-
-
-def check_COLA_signature(window, nperseg, noverlap, tol=1e-10):
-    return array_namespace(_skip_if_str_or_tuple(window))
-
-
-def check_NOLA_signature(window, nperseg, noverlap, tol=1e-10):
-    return array_namespace(_skip_if_str_or_tuple(window))
-
-
-def czt_signature(x, *args, **kwds):
-    return array_namespace(x)
-
-decimate_signature = czt_signature
-gauss_spline_signature = czt_signature
-
-
-def deconvolve_signature(signal, divisor):
-    return array_namespace(signal, divisor)
-
-
-def detrend_signature(data, axis=1, type='linear', bp=0, *args, **kwds):
-    return array_namespace(data, bp)
-
-
-def filtfilt_signature(b, a, x, *args, **kwds):
-    return array_namespace(b, a, x)
-
-
-def lfilter_signature(b, a, x, axis=-1, zi=None):
-    return array_namespace(b, a, x, zi)
-
-
-def envelope_signature(z, *args, **kwds):
-    return array_namespace(z)
-
-
-def find_peaks_signature(
-    x, height=None, threshold=None, distance=None, prominence=None, width=None,
-    wlen=None, rel_height=0.5, plateau_size=None
-):
-    return array_namespace(x, height, threshold, prominence, width, plateau_size)
-
-
-def find_peaks_cwt_signature(
-    vector, widths, wavelet=None, max_distances=None, *args, **kwds
-):
-    return array_namespace(vector, widths, max_distances)
-
-
-def findfreqs_signature(num, den, N, kind='ba'):
-    return array_namespace(num, den)
+# LTI-family delegators: dispatch on the unpacked `system` tuple (or the
+# _LTI_NONE stand-in) plus the listed extra arguments.
+#
+# name -> (parameter list of signal.<name>, extra arguments to dispatch on)
+_LTI_SIGNATURES = {
+    "bode": ("system, w=None, n=100", "w"),
+    "freqresp": ("system, w=None, n=10000", "w"),
+    "impulse": ("system, X0=None, T=None, N=None", "X0, T"),
+    "dimpulse": ("system, x0=None, t=None, n=None", "x0, t"),
+    "lsim": ("system, U, T, X0=None, interp=True", "U, T, X0"),
+    "dlsim": ("system, u, t=None, x0=None", "u, t, x0"),
+}
+
+_LTI_TEMPLATE = """\
+def {name}_signature({params}):
+    sys_args = system if system.__class__ in _lti else _none
+    return _ns(*sys_args, {arrays})
+"""
 
+_generate_signatures(_LTI_SIGNATURES, _LTI_TEMPLATE,
+                     "_ns=_dispatch, _none=_LTI_NONE, _lti=_LTI_TYPES",
+                     globals())
+
+dbode_signature = bode_signature                    # noqa: F821
+dfreqresp_signature = freqresp_signature            # noqa: F821
+step_signature = impulse_signature                  # noqa: F821
+dstep_signature = dimpulse_signature                # noqa: F821
+
+
+def cont2discrete_signature(system, dt, method='zoh', alpha=None, *,
+                            _ns=_dispatch, _np=np, _lti=_LTI_TYPES):
+    return _ns(*system) if system.__class__ in _lti else _np
+
+
+# Spectral delegators with a `window` argument: dispatch on the data
+# arguments, adding `window` only when it is an array-like (not a str,
+# tuple or callable).
+#
+# name -> (parameter list of signal.<name>, data arguments to dispatch on)
+_WINDOW_SIGNATURES = {
+    "coherence": ("x, y, fs=1.0, window='hann', *args, **kwds", "x, y"),
+    "csd": ("x, y, fs=1.0, window='hann', *args, **kwds", "x, y"),
+    "periodogram": ("x, fs=1.0, window='boxcar'", "x"),
+    "welch": ("x, fs=1.0, window='hann', *args, **kwds", "x"),
+    "spectrogram": ("x, fs=1.0, window=('tukey', 0.25), *args, **kwds", "x"),
+    "stft": ("x, fs=1.0, window='hann', *args, **kwds", "x"),
+    "istft": ("Zxx, fs=1.0, window='hann', *args, **kwds", "Zxx"),
+    "resample": ("x, num, t=None, axis=0, window=None, domain='time'",
+                 "x, t"),
+    "resample_poly": ("x, up, down, axis=0, window=('kaiser', 5.0), "
+                      "*args, **kwds", "x"),
+    "check_COLA": ("window, nperseg, noverlap, tol=1e-10", ""),
+    "check_NOLA": ("window, nperseg, noverlap, tol=1e-10", ""),
+}
+
+_WINDOW_TEMPLATE = """\
+def {name}_signature({params}):
+    if isinstance(window, _st) or callable(window):
+        return _ns({arrays})
+    return _ns({arrays_and_window})
+"""
 
-def firls_signature(numtaps, bands, desired, *, weight=None, fs=None):
-    return array_namespace(bands, desired, weight)
+_generate_signatures(_WINDOW_SIGNATURES, _WINDOW_TEMPLATE,
+                     "_ns=_dispatch, _st=_STR_OR_TUPLE", globals())
 
 
-def firwin_signature(numtaps, cutoff, *args, **kwds):
+def firwin_signature(numtaps, cutoff, *args, _ns=_dispatch, **kwds):
     if isinstance(cutoff, int | float):
-        xp = np_compat
-    else:
-        xp = array_namespace(cutoff)
-    return xp
-
-
-def firwin2_signature(numtaps, freq, gain, *args, **kwds):
-    return array_namespace(freq, gain)
-
-
-def freqs_zpk_signature(z, p, k, worN, *args, **kwds):
-    return array_namespace(z, p, worN)
-
-freqz_zpk_signature = freqs_zpk_signature
-
-
-def freqs_signature(b, a, worN=200, *args, **kwds):
-    return array_namespace(b, a, worN)
-
-freqz_signature = freqs_signature
-
-
-def freqz_sos_signature(sos, worN=512, *args, **kwds):
-    return array_namespace(sos, worN)
-
-sosfreqz_signature = freqz_sos_signature
-
-
-def gausspulse_signature(t, *args, **kwds):
-    arr_t = None if isinstance(t, str) else t
-    return array_namespace(arr_t)
-
-
-def group_delay_signature(system, w=512, whole=False, fs=6.283185307179586):
-    return array_namespace(*system, w)
-
-
-def hilbert_signature(x, N=None, axis=-1):
-    return array_namespace(x)
-
-hilbert2_signature = hilbert_signature
-
-
-def iirdesign_signature(wp, ws, *args, **kwds):
-    return array_namespace(wp, ws)
-
-
-def iirfilter_signature(N, Wn, *args, **kwds):
-    return array_namespace(Wn)
-
-
-def invres_signature(r, p, k, tol=0.001, rtype='avg'):
-    return array_namespace(r, p, k)
-
-invresz_signature = invres_signature
-
-
-############################### XXX: excluded, blacklisted on CuPy (mismatched API)
-def lfilter_zi_signature(b, a):
-    return array_namespace(b, a)
-
-def sosfilt_zi_signature(sos):
-    return array_namespace(sos)
-
-# needs to be blacklisted on CuPy (is not implemented)
-def remez_signature(numtaps, bands, desired, *, weight=None, **kwds):
-    return array_namespace(bands, desired, weight)
-#############################################
-
-def lfiltic_signature(b, a, y, x=None):
-    return array_namespace(b, a, y, x)
-
-
-def lombscargle_signature(
-    x, y, freqs, precenter=False, normalize=False, *,
-    weights=None, floating_mean=False
-):
-    return array_namespace(x, y, freqs, weights)
-
-
-def lp2bp_signature(b, a, *args, **kwds):
-    return array_namespace(b, a)
-
-lp2bs_signature = lp2bp_signature
-lp2hp_signature = lp2bp_signature
-lp2lp_signature = lp2bp_signature
-
-tf2zpk_signature = lp2bp_signature
-tf2sos_signature = lp2bp_signature
-
-normalize_signature = lp2bp_signature
-residue_signature = lp2bp_signature 
-residuez_signature = residue_signature
-
-
-def lp2bp_zpk_signature(z, p, k, *args, **kwds):
-    return array_namespace(z, p)
-
-lp2bs_zpk_signature = lp2bp_zpk_signature
-lp2hp_zpk_signature = lp2bs_zpk_signature
-lp2lp_zpk_signature = lp2bs_zpk_signature
-
-
-def zpk2sos_signature(z, p, k, *args, **kwds):
-    return array_namespace(z, p)
-
-zpk2ss_signature = zpk2sos_signature
-zpk2tf_signature = zpk2sos_signature
-
-
-def max_len_seq_signature(nbits, state=None, length=None, taps=None):
-    return array_namespace(state, taps)
-
-
-def medfilt_signature(volume, kernel_size=None):
-    return array_namespace(volume)
-
-
-def medfilt2d_signature(input, kernel_size=3):
-    return array_namespace(input)
-
-
-def minimum_phase_signature(h, *args, **kwds):
-    return array_namespace(h)
-
-
-def order_filter_signature(a, domain, rank):
-    return array_namespace(a, domain)
-
-
-def peak_prominences_signature(x, peaks, *args, **kwds):
-    return array_namespace(x, peaks)
-
-
-peak_widths_signature = peak_prominences_signature
-
-
-def place_poles_signature(A, B, poles, method='YT', rtol=0.001, maxiter=30):
-    return array_namespace(A, B, poles)
-
-
-def savgol_filter_signature(x, *args, **kwds):
-    return array_namespace(x)
-
-
-def sawtooth_signature(t, width=1):
-    return array_namespace(t)
-
-
-def sepfir2d_signature(input, hrow, hcol):
-    return array_namespace(input, hrow, hcol)
-
-
-def sos2tf_signature(sos):
-    return array_namespace(sos)
-
-
-sos2zpk_signature = sos2tf_signature
-
-
-def sosfilt_signature(sos, x, axis=-1, zi=None):
-    return array_namespace(sos, x, zi)
-
-
-def sosfiltfilt_signature(sos, x, *args, **kwds):
-    return array_namespace(sos, x)
-
-
-def spline_filter_signature(Iin, lmbda=5.0):
-    return array_namespace(Iin)
-
-
-def square_signature(t, duty=0.5):
-    return array_namespace(t)
-
-
-def ss2tf_signature(A, B, C, D, input=0):
-    return array_namespace(A, B, C, D)
-
-ss2zpk_signature = ss2tf_signature
-
-
-def sweep_poly_signature(t, poly, phi=0):
-    return array_namespace(t, _skip_if_poly1d(poly))
-
-
-def symiirorder1_signature(signal, c0, z1, precision=-1.0):
-    return array_namespace(signal)
-
-
-def symiirorder2_signature(input, r, omega, precision=-1.0):
-    return array_namespace(input, r, omega)
-
-
-def cspline1d_signature(signal, *args, **kwds):
-    return array_namespace(signal)
-
-qspline1d_signature = cspline1d_signature
-cspline2d_signature = cspline1d_signature
-qspline2d_signature = qspline1d_signature
-
-
-def cspline1d_eval_signature(cj, newx, *args, **kwds):
-    return array_namespace(cj, newx)
-
-qspline1d_eval_signature = cspline1d_eval_signature
-
+        return _return_xp_or_np_compat()
+    return _ns(cutoff)
 
-def tf2ss_signature(num, den):
-    return array_namespace(num, den)
 
+def gausspulse_signature(t, *args, _ns=_dispatch, **kwds):
+    # t is almost always an ndarray; `t == 'cutoff'` is the rare overload,
+    # so an exact-type check beats isinstance's subclass handling here
+    return _ns(None if t.__class__ is str else t)
 
-def unique_roots_signature(p, tol=0.001, rtype='min'):
-    return array_namespace(p)
 
+def group_delay_signature(system, w=512, whole=False, fs=6.283185307179586, *,
+                          _ns=_dispatch):
+    return _ns(*system, w)
 
-def upfirdn_signature(h, x, up=1, down=1, axis=-1, mode='constant', cval=0):
-    return array_namespace(h, x)
 
+def sweep_poly_signature(t, poly, phi=0, *,
+                         _ns=_dispatch, _skip=_skip_if_poly1d):
+    return _ns(t, _skip(poly))
 
-def vectorstrength_signature(events, period):
-    return array_namespace(events, period)
 
+# Precompute `inspect.Signature` objects for every delegator and attach them
+# via `__signature__`, which `inspect.signature` fast-paths on: consumers
+# introspecting the delegators (dispatch machinery, docs, tests) get a
+# cached object instead of a re-parse. The injected underscore aliases
+# (_ns, _st, ...) are stripped, so the exposed signature matches the
+# parameters of the public `signal.func` as the module contract promises.
+_SIG_CACHE = {}
 
-def wiener_signature(im, mysize=None, noise=None):
-    return array_namespace(im)
 
+def _cache_signatures(namespace):
+    for name, fn in list(namespace.items()):
+        if not name.endswith("_signature") or not callable(fn):
+            continue
+        if fn not in _SIG_CACHE:
+            sig = inspect.signature(fn)
+            params = [p for p in sig.parameters.values()
+                      if not p.name.startswith("_")]
+            fn.__signature__ = sig.replace(parameters=params)
+            _SIG_CACHE[fn] = fn.__signature__
 
-def zoom_fft_signature(x, fn, m=None, *, fs=2, endpoint=False, axis=-1):
-    return array_namespace(x, fn)
 
+_cache_signatures(globals())